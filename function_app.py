@@ -9,21 +9,27 @@ from functions import (
     get_filters,
     get_resources_by_batch,
     search_resources,
+    warmup,
+)
+from shared.azure_search_client import (
+    get_async_search_client,
+    get_search_index,
 )
-from shared.azure_search_client import get_search_client
 from shared.database import initialize_database
 
 # Initialize the function app
 app = func.FunctionApp()
 
-# Initialize database connection
+# Initialize database connection once per worker, it holds a connection
+# pool shared by every invocation. The Azure Search client is created on
+# first use by get_async_search_client.
 db, collection = initialize_database()
 
-# Initialize Azure Search client
-search_client = get_search_client()
-
 # Register functions
 get_resources_by_batch.register_function(app, collection)
-search_resources.register_function(app, search_client)
+search_resources.register_function(
+    app, get_async_search_client, get_search_index
+)
 get_filters.register_function(app, collection, db["filter_values"])
 get_dependent_workloads.register_function(app, collection)
+warmup.register_function(app, collection, get_async_search_client)
@@ -1,17 +1,12 @@
 # Copyright (c) 2025 The Regents of the University of California
 # SPDX-License-Identifier: BSD-3-Clause
 
-# Make this directory a package
-from . import (
-    get_dependent_workloads,
-    get_filters,
-    get_resources_by_batch,
-    search_resources,
-)
-
+# Make this directory a package. Submodules are not imported here, so
+# importing one function module does not load the others.
 __all__ = [
     "get_resources_by_batch",
     "search_resources",
     "get_filters",
     "get_dependent_workloads",
+    "warmup",
 ]
@@ -1,13 +1,19 @@
 # Copyright (c) 2025 The Regents of the University of California
 # SPDX-License-Identifier: BSD-3-Clause
 
-import json
 import logging
+import time
 
 import azure.functions as func
-from bson import json_util
 
-from shared.utils import create_error_response
+from shared.utils import (
+    create_error_response,
+    dumps,
+)
+
+# Number of seconds a worker reuses a serialized filters response. The
+# materialized view is only updated once a day.
+FILTERS_CACHE_TTL = 60
 
 
 def register_function(app, collection, filter_values_collection):
@@ -20,6 +26,9 @@ def register_function(app, collection, filter_values_collection):
                                   values
     """
 
+    # Serialized response body and the time.monotonic() it expires at
+    cache = {"body": None, "expires_at": 0.0}
+
     @app.route(route="resources/filters", auth_level=func.AuthLevel.ANONYMOUS)
     def get_filters(req: func.HttpRequest) -> func.HttpResponse:
         """
@@ -29,10 +38,16 @@ def register_function(app, collection, filter_values_collection):
         Route: /resources/filters
 
         This function retrieves pre-computed filter values from a materialized
-        view collection that is updated daily by a GitHub Action.
+        view collection that is updated daily by a GitHub Action. Responses
+        are cached in the worker for FILTERS_CACHE_TTL seconds.
         """
         logging.info("Processing request to get resource filters")
         try:
+            if cache["body"] is not None and (
+                time.monotonic() < cache["expires_at"]
+            ):
+                return create_filters_response(cache["body"])
+
             # Get the filter values from the materialized view collection
             cached_filters = filter_values_collection.find_one(
                 {"_id": "current"}
@@ -47,12 +62,6 @@ def register_function(app, collection, filter_values_collection):
                         "Returning filter values last "
                         f"updated at {last_updated}"
                     )
-
-                return func.HttpResponse(
-                    body=json.dumps(filters, default=json_util.default),
-                    headers={"Content-Type": "application/json"},
-                    status_code=200,
-                )
             else:
                 logging.warning(
                     "No cached filter values found. "
@@ -91,41 +100,43 @@ def register_function(app, collection, filter_values_collection):
 
                 # If no results, return empty arrays
                 if not results:
-                    return func.HttpResponse(
-                        body=json.dumps(
-                            {
-                                "category": [],
-                                "architecture": [],
-                                "gem5_versions": [],
-                            }
-                        ),
-                        headers={"Content-Type": "application/json"},
-                        status_code=200,
-                    )
-
-                # Process the results
-                filters = results[0]
-
-                # Filter out null values from architecture
-                if "architecture" in filters:
-                    filters["architecture"] = [
-                        a for a in filters["architecture"] if a is not None
-                    ]
-
-                # Sort the arrays
-                if "category" in filters:
-                    filters["category"].sort()
-                if "architecture" in filters:
-                    filters["architecture"].sort()
-                if "gem5_versions" in filters:
-                    filters["gem5_versions"].sort(reverse=True)
-
-                return func.HttpResponse(
-                    body=json.dumps(filters, default=json_util.default),
-                    headers={"Content-Type": "application/json"},
-                    status_code=200,
-                )
+                    filters = {
+                        "category": [],
+                        "architecture": [],
+                        "gem5_versions": [],
+                    }
+                else:
+                    # Process the results
+                    filters = results[0]
+
+                    # Filter out null values from architecture
+                    if "architecture" in filters:
+                        filters["architecture"] = [
+                            a for a in filters["architecture"] if a is not None
+                        ]
+
+                    # Sort the arrays
+                    if "category" in filters:
+                        filters["category"].sort()
+                    if "architecture" in filters:
+                        filters["architecture"].sort()
+                    if "gem5_versions" in filters:
+                        filters["gem5_versions"].sort(reverse=True)
+
+            cache["body"] = dumps(filters)
+            cache["expires_at"] = time.monotonic() + FILTERS_CACHE_TTL
+
+            return create_filters_response(cache["body"])
 
         except Exception as e:
             logging.error(f"Error getting resource filters: {str(e)}")
             return create_error_response(500, "Internal server error")
+
+
+def create_filters_response(body):
+    """Create the filters response from a serialized body."""
+    return func.HttpResponse(
+        body=body,
+        headers={"Content-Type": "application/json"},
+        status_code=200,
+    )
@@ -1,7 +1,6 @@
 # Copyright (c) 2025 The Regents of the University of California
 # SPDX-License-Identifier: BSD-3-Clause
 
-import json
 import logging
 
 import azure.functions as func
@@ -9,10 +8,14 @@ import azure.functions as func
 from shared.database import RESOURCE_FIELDS
 from shared.utils import (
     create_error_response,
+    dumps_documents,
     sanitize_id,
     sanitize_version,
 )
 
+# Number of documents fetched from MongoDB per round-trip
+CURSOR_BATCH_SIZE = 500
+
 
 def register_function(app, collection):
     """Register the function with the app."""
@@ -76,12 +79,12 @@ def register_function(app, collection):
                     # Otherwise, find the specific version
                     queries.append({"id": id, "resource_version": version})
 
-            resources = list(
-                collection.find({"$or": queries}, RESOURCE_FIELDS)
-            )
+            cursor = collection.find(
+                {"$or": queries}, RESOURCE_FIELDS
+            ).batch_size(CURSOR_BATCH_SIZE)
 
             return func.HttpResponse(
-                body=json.dumps(resources),
+                body=dumps_documents(cursor),
                 status_code=200,
                 headers={"Content-Type": "application/json"},
             )
@@ -1,25 +1,138 @@
 # Copyright (c) 2025 The Regents of the University of California
 # SPDX-License-Identifier: BSD-3-Clause
 
-import json
 import logging
+import time
 
 import azure.functions as func
 
+from shared.search_index import (
+    ID_SORT_FIELD,
+    ID_WEIGHT,
+    INTERNAL_FIELDS,
+    LATEST_FIELD,
+    SCORING_PROFILE,
+    get_returned_fields,
+    has_field,
+    has_scoring_profile,
+)
 from shared.utils import (
+    ID_PATTERN,
     create_error_response,
+    dumps,
+    keep_latest_versions,
     sanitize_contains_str,
-    sanitize_id,
     sanitize_must_include,
 )
 
+# Filter keeping only the latest version of every resource, on an index
+# prepared by update_search_index.py. Documents indexed since its last run
+# have no flag yet and are kept, so new resources are found right away.
+LATEST_VERSION_FILTER = f"{LATEST_FIELD} ne false"
+
+# Number of seconds a worker reuses the search index definition, so that
+# newly prepared indexes are picked up without a restart
+INDEX_CACHE_TTL = 300
+
+# Number of results fetched when the page cannot be selected server-side
+MAX_RESULTS = 1000  # Max allowed by Azure AI Search
+
+# Fields searched by contains-str
+SEARCH_FIELDS = ["id", "description", "category", "architecture", "tags"]
+
+# Fields that can be filtered on with must-include, mapped to whether they
+# are collection fields
+FILTER_FIELDS = {
+    "category": False,
+    "architecture": False,
+    "tags": True,
+    "gem5_versions": True,
+}
+
+# Lucene clause matching one search term, as a quoted phrase for exact
+# matches plus a prefix query for partial matches
+TERM_CLAUSE_TEMPLATE = '("{term}" OR {term}*)'
+
+# Term clause used when the index has no scoring profile boosting matches on
+# id, boosting them in the query instead
+BOOSTED_TERM_CLAUSE_TEMPLATE = (
+    '(id:"{term}"^{weight} OR id:{term}*^{weight} OR "{term}" OR {term}*)'
+)
+
+# Translation table prefixing every Lucene special character with a backslash
+LUCENE_ESCAPE_TABLE = str.maketrans(
+    {char: f"\\{char}" for char in '\\+-&|!(){}[]^~*?:/"'}
+)
+
+# Accepted values of the sort parameter, anything else sorts by relevance
+VALID_SORTS = frozenset({"date", "name", "version", "id_asc", "id_desc"})
+
+# Largest $skip value accepted by Azure AI Search
+MAX_SKIP = 100000
+
+# Sort parameters that can be ordered by the search service. The id is used
+# as a tie-breaker so that pages stay stable across requests.
+SORT_ORDER_BY = {
+    "date": ["date desc", "id asc"],
+    "name": [f"{ID_SORT_FIELD} asc"],
+    "id_asc": [f"{ID_SORT_FIELD} asc"],
+    "id_desc": [f"{ID_SORT_FIELD} desc"],
+    "default": ["search.score() desc", "id asc"],
+}
+
+
+def id_sort_key(doc):
+    """Sort key ordering documents by id, ignoring case."""
+    return doc.get("id", "").lower()
+
+
+def version_sort_key(doc):
+    """Sort key ordering documents by their newest gem5 version."""
+    return max(doc.get("gem5_versions", ["0"]), default="0")
+
+
+# Sort parameters applied to the first MAX_RESULTS matches when the search
+# service cannot order by them, mapped to their (key function, reverse)
+# pair: the version sort always, the id sorts on an index without
+# ID_SORT_FIELD
+SORT_KEYS = {
+    "name": (id_sort_key, False),
+    "id_asc": (id_sort_key, False),
+    "id_desc": (id_sort_key, True),
+    "version": (version_sort_key, True),
+}
+
+
+def register_function(app, get_search_client, get_search_index):
+    """Register the function with the app.
+
+    Args:
+        app: The Azure Functions app
+        get_search_client: Callable returning the shared asynchronous Azure
+                           AI Search client
+        get_search_index: Coroutine function fetching the search index
+                          definition
+    """
 
-def register_function(app, search_client):
-    """Register the function with the app."""
+    # Search index definition and the time.monotonic() it expires at
+    index_cache = {"index": None, "expires_at": 0.0}
+
+    async def get_cached_search_index():
+        """Return the search index definition, or None if unavailable."""
+        if time.monotonic() >= index_cache["expires_at"]:
+            try:
+                index_cache["index"] = await get_search_index()
+            except Exception as e:
+                # Search still works without the definition, only with the
+                # slower queries of an index that was not prepared
+                logging.warning(f"Error fetching search index: {str(e)}")
+                index_cache["index"] = None
+            index_cache["expires_at"] = time.monotonic() + INDEX_CACHE_TTL
+        return index_cache["index"]
 
     @app.function_name(name="search_resources")
     @app.route(route="resources/search", auth_level=func.AuthLevel.ANONYMOUS)
-    def search_resources(req: func.HttpRequest) -> func.HttpResponse:
+    async def search_resources(req: func.HttpRequest) -> func.HttpResponse:
         """
         Search resources with filtering capabilities using Azure AI Search.
 
@@ -45,14 +158,9 @@ def register_function(app, search_client):
             )
 
             # Get sort parameter
-            sort_param = req.params.get("sort")
-            if sort_param:
-                sort_param = (
-                    sort_param
-                    if sort_param
-                    in ["date", "name", "version", "id_asc", "id_desc"]
-                    else "default"
-                )
+            sort_param = req.params.get("sort") or "default"
+            if sort_param not in VALID_SORTS:
+                sort_param = "default"
 
             # Get pagination parameters
             try:
@@ -74,7 +182,7 @@ def register_function(app, search_client):
 
             query_object = {
                 "query": contains_str,
-                "sort": sort_param if sort_param else "default",
+                "sort": sort_param,
             }
 
             if must_include:
@@ -83,103 +191,134 @@ def register_function(app, search_client):
                     for group in must_include.split(";"):
                         if not group:
                             continue
-                        parts = group.split(",")
-                        if len(parts) < 2:
+                        field, *values = group.split(",")
+                        if not values:
                             return create_error_response(
                                 400, "Invalid filter format"
                             )
 
-                        field = parts[0]
-                        values = [sanitize_id(v) for v in parts[1:]]
-                        if not all(values):
+                        # must_include is already stripped of whitespace,
+                        # only the id pattern needs checking
+                        if not all(ID_PATTERN.match(v) for v in values):
                             return create_error_response(
                                 400, "Invalid filter value format"
                             )
 
-                        query_object[field] = values
+                        # Only filterable fields are read from the group,
+                        # it must not override the other query parameters
+                        if field in FILTER_FIELDS:
+                            query_object[field] = values
                 except Exception as e:
                     logging.error(f"Error parsing filter criteria: {str(e)}")
                     return create_error_response(400, "Invalid filter format")
 
             odata_filter = build_odata_filter(query_object)
 
+            index = await get_cached_search_index()
+            scoring_profile = (
+                SCORING_PROFILE
+                if has_scoring_profile(index, SCORING_PROFILE)
+                else None
+            )
+
             # Build search text with Lucene query syntax
             # Mimics MongoDB Atlas Search behavior:
             # - Text search across id, description, category, architecture, tags
-            # - Boost matches on id field
+            # - Boost matches on id field (through the scoring profile, or
+            #   in the query on an index without it)
             # - Word order doesn't matter (each term searched independently)
-            if contains_str:
-                # Split into terms - Atlas Search tokenizes and matches each term
-                terms = contains_str.split()
-
-                # Build query that requires all terms (like Atlas "must" clause)
-                # but allows them in any order and any field
-                term_clauses = []
-                for term in terms:
-                    escaped_term = escape_lucene_query(term)
-                    # Search each term across all searchable fields
-                    # Use quoted phrase for exact matching, plus unquoted for partial
-                    # Boost id matches by 10x (like Atlas Search boost)
-                    term_clauses.append(
-                        f'(id:"{escaped_term}"^10 OR id:{escaped_term}*^10 OR '
-                        f'description:"{escaped_term}" OR description:{escaped_term}* OR '
-                        f'category:"{escaped_term}" OR category:{escaped_term}* OR '
-                        f'architecture:"{escaped_term}" OR architecture:{escaped_term}* OR '
-                        f'tags:"{escaped_term}" OR tags:{escaped_term}* OR '
-                        f'"{escaped_term}" OR {escaped_term}*)'
+            # Split into terms - Atlas Search tokenizes and matches each term
+            terms = contains_str.split()
+            if terms:
+                # Build query that requires all terms (like Atlas "must"
+                # clause) but allows them in any order and any field. The
+                # searched fields are passed as search_fields rather than
+                # spelled out for every term.
+                template = (
+                    TERM_CLAUSE_TEMPLATE
+                    if scoring_profile
+                    else BOOSTED_TERM_CLAUSE_TEMPLATE
+                )
+                search_text = " AND ".join(
+                    template.format(
+                        term=escape_lucene_query(t), weight=ID_WEIGHT
                     )
-
-                # Join with AND - all terms must match (like Atlas "must" clause)
-                search_text = " AND ".join(term_clauses)
+                    for t in terms
+                )
                 query_type = "full"  # Lucene query syntax
             else:
                 search_text = "*"
                 query_type = "simple"
 
-            # Fetch ALL results from Azure AI Search (no server-side pagination)
-            # We need all results to deduplicate by id and keep only latest version
-            all_results = []
-
-            results = search_client.search(
-                search_text=search_text,
-                filter=odata_filter,
-                include_total_count=True,
-                top=1000,  # Max allowed by Azure AI Search
-                query_type=query_type,
-            )
-
-            for result in results:
-                # Convert to dict and add score
-                doc = dict(result)
-                doc["score"] = result.get("@search.score", 0)
-                all_results.append(doc)
-
-            logging.info(f"Raw results count: {len(all_results)}")
-
-            unique_resources = keep_latest_versions(all_results)
+            # On an index prepared by update_search_index.py older versions
+            # of a resource are flagged out, so deduplication, sorting and
+            # pagination all happen server-side and only the requested page
+            # is transferred.
+            latest_flagged = has_field(index, LATEST_FIELD)
+            if latest_flagged and odata_filter:
+                odata_filter = f"{odata_filter} and {LATEST_VERSION_FILTER}"
+            elif latest_flagged:
+                odata_filter = LATEST_VERSION_FILTER
+
+            search_options = {
+                "search_text": search_text,
+                "filter": odata_filter,
+                "query_type": query_type,
+                "search_mode": "all",
+                "search_fields": SEARCH_FIELDS,
+                "scoring_profile": scoring_profile,
+                "select": get_returned_fields(index),
+            }
 
-            # Apply sorting
-            sorted_resources = apply_sorting(
-                unique_resources, query_object.get("sort", "default")
-            )
+            sort = sort_param
+            skip = (page - 1) * page_size
 
-            # Calculate total count before pagination
-            total_count = len(sorted_resources)
+            search_client = get_search_client()
 
-            # Apply pagination
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            paginated_results = sorted_resources[start_idx:end_idx]
+            order_by = get_order_by(sort, index)
 
-            # Clean up results for response
+            if latest_flagged and order_by:
+                results = await search_client.search(
+                    **search_options,
+                    include_total_count=True,
+                    order_by=order_by,
+                    # Pages past the service's skip limit are empty, only
+                    # the total count is requested for them
+                    top=page_size if skip <= MAX_SKIP else 0,
+                    skip=min(skip, MAX_SKIP),
+                )
+                paginated_results = [result async for result in results]
+                total_count = await results.get_count()
+            else:
+                # Without the latest-version flag the versions of a resource
+                # are deduplicated here, and sorts on fields the index cannot
+                # order by are applied here, so the page is sliced from the
+                # first MAX_RESULTS matches
+                results = await search_client.search(
+                    **search_options,
+                    order_by=order_by,
+                    top=MAX_RESULTS,
+                )
+                resources = [result async for result in results]
+                if not latest_flagged:
+                    # Each resource keeps the position of its first version
+                    # in the service's ordering
+                    resources = keep_latest_versions(resources)
+                if not order_by:
+                    resources = apply_sorting(resources, sort)
+                total_count = len(resources)
+                paginated_results = resources[skip : skip + page_size]
+
+            # Clean up results for response. The SDK yields a fresh dict for
+            # every result, so they are modified in place.
             for resource in paginated_results:
-                # Remove Azure Search internal fields
-                keys_to_remove = [
-                    "@search.score",
-                    "@search.highlights",
-                    "@search.reranker_score",
-                ]
-                for key in keys_to_remove:
+                resource["score"] = resource.get("@search.score", 0)
+                # Remove the Azure Search metadata the SDK adds to every
+                # result (@search.score, @search.highlights, ...)
+                for key in [k for k in resource if k.startswith("@search.")]:
+                    del resource[key]
+                # Without the index definition every field is selected
+                for key in INTERNAL_FIELDS:
                     resource.pop(key, None)
                 resource["database"] = "gem5-vision"
 
@@ -189,7 +328,7 @@ def register_function(app, search_client):
             }
 
             return func.HttpResponse(
-                body=json.dumps(response_data),
+                body=dumps(response_data),
                 headers={"Content-Type": "application/json"},
                 status_code=200,
             )
@@ -212,176 +351,103 @@ def escape_lucene_query(query_str):
     Returns:
     - str: The escaped query string safe for Lucene syntax.
     """
-    # Characters that need escaping in Lucene (except quotes which are used for phrases)
-    special_chars = [
-        "\\",
-        "+",
-        "-",
-        "&",
-        "|",
-        "!",
-        "(",
-        ")",
-        "{",
-        "}",
-        "[",
-        "]",
-        "^",
-        "~",
-        "*",
-        "?",
-        ":",
-        "/",
-    ]
+    return query_str.translate(LUCENE_ESCAPE_TABLE)
 
-    escaped = query_str
-    for char in special_chars:
-        escaped = escaped.replace(char, f"\\{char}")
 
-    escaped = escaped.replace('"', '\\"')
+def escape_odata_string(value):
+    """
+    Escape a value for use inside an OData string literal, where single
+    quotes are escaped by doubling them.
 
-    return escaped
+    Parameters:
+    - value (str): The raw value.
 
+    Returns:
+    - str: The escaped value.
+    """
+    return value.replace("'", "''")
 
-def build_odata_filter(query_object):
+
+def build_or_filter(field, values, collection=False):
     """
-    Build an OData filter string for Azure AI Search based on query parameters.
+    Build an OData filter matching any of the given values of a field.
 
     Parameters:
-    - query_object (dict): Dictionary containing filter keys and values.
+    - field (str): Name of the index field.
+    - values (list): Values to match, or None.
+    - collection (bool): Whether the field is a collection of strings.
 
     Returns:
-    - str or None: OData filter string, or None if no filters.
+    - str or None: OData filter string, or None if there are no values.
     """
-    filters = []
-
-    # Filter by category
-    if query_object.get("category"):
-        values = query_object["category"]
-        if len(values) == 1:
-            filters.append(f"category eq '{values[0]}'")
-        else:
-            category_filters = " or ".join(
-                [f"category eq '{v}'" for v in values]
-            )
-            filters.append(f"({category_filters})")
-
-    # Filter by architecture
-    if query_object.get("architecture"):
-        values = query_object["architecture"]
-        if len(values) == 1:
-            filters.append(f"architecture eq '{values[0]}'")
-        else:
-            arch_filters = " or ".join(
-                [f"architecture eq '{v}'" for v in values]
-            )
-            filters.append(f"({arch_filters})")
-
-    # Filter by tags (collection field)
-    if query_object.get("tags"):
-        values = query_object["tags"]
-        tag_filters = " or ".join([f"tags/any(t: t eq '{v}')" for v in values])
-        filters.append(f"({tag_filters})")
-
-    # Filter by gem5_versions (collection field)
-    if query_object.get("gem5_versions"):
-        values = query_object["gem5_versions"]
-        version_filters = " or ".join(
-            [f"gem5_versions/any(v: v eq '{v}')" for v in values]
-        )
-        filters.append(f"({version_filters})")
+    if not values:
+        return None
 
-    if filters:
-        return " and ".join(filters)
-    return None
+    if collection:
+        parts = [
+            f"{field}/any(x: x eq '{escape_odata_string(v)}')" for v in values
+        ]
+    else:
+        parts = [f"{field} eq '{escape_odata_string(v)}'" for v in values]
+
+    if len(parts) == 1:
+        return parts[0]
+    return f"({' or '.join(parts)})"
 
 
-def parse_version(version_str):
+def build_odata_filter(query_object):
     """
-    Parse a semantic version string (x.y.z) into a tuple of integers for comparison.
+    Build an OData filter string for Azure AI Search based on query parameters.
 
     Parameters:
-    - version_str (str): Version string like "1.2.3"
+    - query_object (dict): Dictionary containing filter keys and values.
 
     Returns:
-    - tuple: Tuple of integers (major, minor, patch) or (0, 0, 0) if parsing fails.
+    - str or None: OData filter string, or None if no filters.
     """
-    try:
-        parts = version_str.split(".")
-        return tuple(int(p) for p in parts)
-    except (ValueError, AttributeError):
-        return (0, 0, 0)
+    filters = [
+        build_or_filter(field, query_object.get(field), collection)
+        for field, collection in FILTER_FIELDS.items()
+    ]
+    filters = [f for f in filters if f]
+
+    if filters:
+        return " and ".join(filters)
+    return None
 
 
-def keep_latest_versions(results):
+def get_order_by(sort_param, index):
     """
-    Deduplicate results by resource id, keeping only the document with
-    the highest semantic version. Also preserves the maximum search score
-    across all versions for proper relevance sorting.
+    Build the $orderby clauses of a sort parameter.
 
     Parameters:
-    - results (list): List of search result documents.
+    - sort_param (str): Sort parameter.
+    - index (SearchIndex): The index definition, or None if unknown.
 
     Returns:
-    - list: List of unique resources with only the latest version.
+    - list or None: The clauses, or None if the search service cannot
+      order by the sort parameter.
     """
-    latest_by_id = {}
-    max_score_by_id = {}
-
-    for doc in results:
-        resource_id = doc.get("id")
-        if not resource_id:
-            continue
-
-        current_version = parse_version(doc.get("resource_version", "0.0.0"))
-        current_score = doc.get("score", 0)
-
-        if resource_id not in max_score_by_id:
-            max_score_by_id[resource_id] = current_score
-        else:
-            max_score_by_id[resource_id] = max(
-                max_score_by_id[resource_id], current_score
-            )
+    if sort_param not in SORT_ORDER_BY:
+        return None
 
-        if resource_id not in latest_by_id:
-            latest_by_id[resource_id] = doc
-        else:
-            existing_version = parse_version(
-                latest_by_id[resource_id].get("resource_version", "0.0.0")
-            )
-            if current_version > existing_version:
-                latest_by_id[resource_id] = doc
-
-    for resource_id, doc in latest_by_id.items():
-        doc["score"] = max_score_by_id.get(resource_id, 0)
-
-    return list(latest_by_id.values())
+    # An index that was not prepared can only order ids case-sensitively,
+    # so the id sorts are applied by apply_sorting instead
+    if sort_param in SORT_KEYS and not has_field(index, ID_SORT_FIELD):
+        return None
+    return SORT_ORDER_BY[sort_param]
 
 
 def apply_sorting(results, sort_param):
     """
-    Sort results based on the sort parameter.
+    Sort results on a sort parameter the search service cannot order by.
 
     Parameters:
     - results (list): List of documents to sort.
-    - sort_param (str): Sort parameter ('date', 'name', 'version', 'id_asc', 'id_desc', or 'default').
+    - sort_param (str): Sort parameter, one of SORT_KEYS.
 
     Returns:
     - list: Sorted list of documents.
     """
-    if sort_param == "date":
-        return sorted(results, key=lambda x: x.get("date", ""), reverse=True)
-    elif sort_param == "name" or sort_param == "id_asc":
-        return sorted(results, key=lambda x: x.get("id", "").lower())
-    elif sort_param == "id_desc":
-        return sorted(
-            results, key=lambda x: x.get("id", "").lower(), reverse=True
-        )
-    elif sort_param == "version":
-        return sorted(
-            results,
-            key=lambda x: max(x.get("gem5_versions", ["0"]), default="0"),
-            reverse=True,
-        )
-    else:
-        return sorted(results, key=lambda x: x.get("score", 0), reverse=True)
+    key, reverse = SORT_KEYS[sort_param]
+    return sorted(results, key=key, reverse=reverse)
@@ -0,0 +1,47 @@
+# Copyright (c) 2025 The Regents of the University of California
+# SPDX-License-Identifier: BSD-3-Clause
+
+import asyncio
+import logging
+
+import azure.functions as func
+
+from shared.utils import create_error_response
+
+
+def register_function(app, collection, get_search_client):
+    """Register the function with the app.
+
+    Args:
+        app: The Azure Functions app
+        collection: The resources collection
+        get_search_client: Callable returning the shared asynchronous Azure
+                           AI Search client
+    """
+
+    # Routes starting with "admin" are reserved by the Functions host
+    @app.route(route="warmup", auth_level=func.AuthLevel.ANONYMOUS)
+    async def warmup(req: func.HttpRequest) -> func.HttpResponse:
+        """
+        Warm up the shared Azure AI Search and MongoDB clients.
+
+        Route: /warmup
+
+        Creates the search client if needed and sends one cheap request
+        through each client so that connections are opened and the HTTP
+        pipeline and database driver are initialized before real traffic
+        reaches the worker.
+        """
+        logging.info("Processing warmup request")
+        try:
+            await asyncio.gather(
+                get_search_client().get_document_count(),
+                # pymongo is synchronous, keep it off the event loop
+                asyncio.to_thread(collection.find_one, {}, {"_id": 1}),
+            )
+
+            return func.HttpResponse(status_code=204)
+
+        except Exception as e:
+            logging.error(f"Error warming up clients: {str(e)}")
+            return create_error_response(500, "Internal server error")
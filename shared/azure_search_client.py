@@ -3,14 +3,12 @@
 
 import logging
 import os
+from functools import lru_cache
 
-from azure.core.credentials import AzureKeyCredential
-from azure.search.documents import SearchClient
 
-
-def get_search_client():
+def get_search_settings():
     """
-    Creates and returns an Azure AI Search client.
+    Reads the Azure AI Search settings from the environment.
 
     Required environment variables:
     - AZURE_SEARCH_ENDPOINT: The Azure AI Search service endpoint
@@ -18,7 +16,7 @@ def get_search_client():
     - AZURE_SEARCH_INDEX_NAME: The name of the search index
 
     Returns:
-        SearchClient: An Azure AI Search client instance
+        tuple: The endpoint, API key and index name
     """
     endpoint = os.environ.get("AZURE_SEARCH_ENDPOINT")
     api_key = os.environ.get("AZURE_SEARCH_API_KEY")
@@ -31,9 +29,85 @@ def get_search_client():
             "AZURE_SEARCH_ENDPOINT, AZURE_SEARCH_API_KEY, or AZURE_SEARCH_INDEX_NAME"
         )
 
+    return endpoint, api_key, index_name
+
+
+@lru_cache(maxsize=1)
+def get_search_client():
+    """
+    Creates and returns an Azure AI Search client.
+
+    The client is created once per worker process and reused by every
+    invocation, as it holds the HTTP connection pool. The SDK is imported
+    on the first call so that workers which never serve a search request
+    do not load it.
+
+    Returns:
+        SearchClient: An Azure AI Search client instance
+    """
+    from azure.core.credentials import AzureKeyCredential
+    from azure.search.documents import SearchClient
+
+    endpoint, api_key, index_name = get_search_settings()
     credential = AzureKeyCredential(api_key)
     client = SearchClient(
         endpoint=endpoint, index_name=index_name, credential=credential
     )
 
     return client
+
+
+@lru_cache(maxsize=1)
+def get_async_search_client():
+    """
+    Creates and returns an asynchronous Azure AI Search client.
+
+    Like get_search_client, the client is created on the first call and
+    shared by every invocation of the worker. It must be used from async
+    functions, which all run on the worker's event loop.
+
+    Returns:
+        SearchClient: An azure.search.documents.aio client instance
+    """
+    from azure.core.credentials import AzureKeyCredential
+    from azure.search.documents.aio import SearchClient
+
+    endpoint, api_key, index_name = get_search_settings()
+    credential = AzureKeyCredential(api_key)
+    client = SearchClient(
+        endpoint=endpoint, index_name=index_name, credential=credential
+    )
+
+    return client
+
+
+@lru_cache(maxsize=1)
+def get_async_search_index_client():
+    """
+    Creates and returns an asynchronous Azure AI Search index client.
+
+    It is used to read the definition of the search index, and like the
+    search client it is created once and shared by every invocation.
+
+    Returns:
+        SearchIndexClient: An azure.search.documents.indexes.aio client
+                           instance
+    """
+    from azure.core.credentials import AzureKeyCredential
+    from azure.search.documents.indexes.aio import SearchIndexClient
+
+    endpoint, api_key, _ = get_search_settings()
+    credential = AzureKeyCredential(api_key)
+
+    return SearchIndexClient(endpoint=endpoint, credential=credential)
+
+
+async def get_search_index():
+    """
+    Fetches the definition of the search index.
+
+    Returns:
+        SearchIndex: The fields, scoring profiles, ... of the index
+    """
+    _, _, index_name = get_search_settings()
+    return await get_async_search_index_client().get_index(index_name)
@@ -46,6 +46,14 @@ RESOURCE_FIELDS = {
     "_id": 0,
 }
 
+# Indexes backing the queries of the API endpoints
+RESOURCE_INDEXES = [
+    # find-resources-in-batch matches on id, or on id and resource_version
+    [("id", pymongo.ASCENDING), ("resource_version", pymongo.ASCENDING)],
+    # get-dependent-workloads starts by matching workloads
+    [("category", pymongo.ASCENDING)],
+]
+
 
 def initialize_database():
     """Initialize MongoDB connection."""
@@ -64,3 +72,14 @@ def initialize_database():
     except Exception as e:
         logging.error(f"Error initializing database: {str(e)}")
         raise
+
+
+def ensure_indexes(collection):
+    """
+    Create the indexes the API queries rely on if they do not exist.
+
+    This needs write access to the database, so it is run by the
+    maintenance scripts rather than when the function app starts.
+    """
+    for keys in RESOURCE_INDEXES:
+        collection.create_index(keys)
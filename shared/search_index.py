@@ -0,0 +1,76 @@
+# Copyright (c) 2025 The Regents of the University of California
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Definitions the search endpoint relies on in the Azure AI Search index.
+
+update_search_index.py adds them to the index and keeps their values up to
+date. The search endpoint checks which of them the index defines, so it
+keeps working (with slower queries) on an index that was not prepared.
+"""
+
+# Boolean field flagging the latest version of every resource
+LATEST_FIELD = "is_latest"
+
+# Sortable lowercase copy of the id. Azure AI Search sorts strings
+# case-sensitively, and a normalizer cannot be added to the existing id
+# field, so the id sorts order by this field instead.
+ID_SORT_FIELD = "id_sort"
+
+# Scoring profile boosting matches on id (like the Atlas Search boost)
+SCORING_PROFILE = "boost_id"
+ID_WEIGHT = 10
+
+# Fields only maintained for the search endpoint, not returned with results
+INTERNAL_FIELDS = frozenset({LATEST_FIELD, ID_SORT_FIELD})
+
+
+def has_field(index, name):
+    """
+    Check whether the index defines a field.
+
+    Parameters:
+    - index (SearchIndex): The index definition, or None if unknown.
+    - name (str): Name of the field.
+
+    Returns:
+    - bool: True if the index is known and defines the field.
+    """
+    return index is not None and any(f.name == name for f in index.fields)
+
+
+def get_returned_fields(index):
+    """
+    List the fields returned with search results: every retrievable field
+    of the index except the internal ones.
+
+    Parameters:
+    - index (SearchIndex): The index definition, or None if unknown.
+
+    Returns:
+    - list or None: The field names, or None (every retrievable field) if
+      the index is unknown.
+    """
+    if index is None:
+        return None
+    return [
+        f.name
+        for f in index.fields
+        if not f.hidden and f.name not in INTERNAL_FIELDS
+    ]
+
+
+def has_scoring_profile(index, name):
+    """
+    Check whether the index defines a scoring profile.
+
+    Parameters:
+    - index (SearchIndex): The index definition, or None if unknown.
+    - name (str): Name of the scoring profile.
+
+    Returns:
+    - bool: True if the index is known and defines the scoring profile.
+    """
+    return index is not None and any(
+        p.name == name for p in index.scoring_profiles or []
+    )
@@ -4,10 +4,20 @@
 
 import json
 import re
+from functools import lru_cache
 
 import azure.functions as func
+import orjson
 from bson import json_util
 
+# Validation patterns, compiled once at import
+ID_PATTERN = re.compile(r"^[\w\-\.]{1,100}$")
+VERSION_PATTERN = re.compile(r"^[0-9\.]{1,20}$")
+CONTAINS_STR_DISALLOWED = re.compile(
+    r"[^\w\s\-\.,:;!?@#%&()\[\]{}<>/\\=+*\'\"]"
+)
+MUST_INCLUDE_DISALLOWED = re.compile(r"[^\w,;\-\.]")
+
 
 def create_error_response(status_code: int, message: str) -> func.HttpResponse:
     """Create an error response with appropriate headers."""
@@ -23,7 +33,7 @@ def sanitize_id(value):
     if not isinstance(value, str):
         return None
     value = value.strip()
-    if not re.match(r"^[\w\-\.]{1,100}$", value):
+    if not ID_PATTERN.match(value):
         return None
     return value
 
@@ -33,7 +43,7 @@ def sanitize_version(value):
     if not isinstance(value, str):
         return None
     value = value.strip()
-    if not re.match(r"^[0-9\.]{1,20}$", value):
+    if not VERSION_PATTERN.match(value):
         return None
     return value
 
@@ -43,7 +53,7 @@ def sanitize_contains_str(value):
     if not isinstance(value, str):
         return ""
     value = value.strip()
-    value = re.sub(r"[^\w\s\-\.,:;!?@#%&()\[\]{}<>/\\=+*\'\"]", "", value)
+    value = CONTAINS_STR_DISALLOWED.sub("", value)
     return value[:200]
 
 
@@ -53,14 +63,81 @@ def sanitize_must_include(value):
     if not isinstance(value, str):
         return ""
     value = value.strip()
-    value = re.sub(r"[^\w,;\-\.]", "", value)
+    value = MUST_INCLUDE_DISALLOWED.sub("", value)
     return value[:500]
 
 
+@lru_cache(maxsize=1024)
+def parse_version(version_str):
+    """
+    Parse a semantic version string (x.y.z) into a tuple of integers for comparison.
+
+    Parameters:
+    - version_str (str): Version string like "1.2.3"
+
+    Returns:
+    - tuple: Tuple of integers (major, minor, patch) or (0, 0, 0) if parsing fails.
+    """
+    try:
+        parts = version_str.split(".")
+        return tuple(int(p) for p in parts)
+    except (ValueError, AttributeError):
+        return (0, 0, 0)
+
+
+def keep_latest_versions(documents):
+    """
+    Deduplicate documents by resource id, keeping only the document with
+    the highest semantic version.
+
+    Parameters:
+    - documents (list): List of resource documents.
+
+    Returns:
+    - list: List of unique resources with only the latest version.
+    """
+    # Maps each resource id to (parsed version, document) so the version of
+    # the current latest document is never parsed again
+    latest_by_id = {}
+
+    for doc in documents:
+        resource_id = doc.get("id")
+        if not resource_id:
+            continue
+
+        version = parse_version(doc.get("resource_version", "0.0.0"))
+        latest = latest_by_id.get(resource_id)
+        if latest is None or version > latest[0]:
+            latest_by_id[resource_id] = (version, doc)
+
+    return [doc for _, doc in latest_by_id.values()]
+
+
+def dumps(data):
+    """Serialize data to JSON bytes, falling back to BSON-aware encoding."""
+    return orjson.dumps(data, default=json_util.default)
+
+
+def dumps_documents(documents):
+    """
+    Serialize an iterable of documents to a JSON array.
+
+    Documents are encoded one by one as they are consumed, so a database
+    cursor never needs to be materialized as a list.
+    """
+    body = bytearray(b"[")
+    for document in documents:
+        if len(body) > 1:
+            body += b","
+        body += dumps(document)
+    body += b"]"
+    return body
+
+
 def create_json_response(data, status_code=200):
     """Create a JSON response with the given data."""
     return func.HttpResponse(
-        body=json.dumps(data, default=json_util.default),
+        body=dumps(data),
         headers={"Content-Type": "application/json"},
         status_code=status_code,
     )
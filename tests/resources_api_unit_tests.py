@@ -2,199 +2,261 @@
 # Copyright (c) 2025 The Regents of the University of California
 # SPDX-License-Identifier: BSD-3-Clause
 
+import asyncio
 import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
+import urllib3
+
+# API endpoints under test, resolved once at import
+_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:7071/api")
+_SEARCH_URL = f"{_BASE_URL}/resources/search"
+_BATCH_URL = f"{_BASE_URL}/resources/find-resources-in-batch"
+_FILTERS_URL = f"{_BASE_URL}/resources/filters"
+
+# HTTP/2 multiplexes concurrent requests on a single connection; httpx only
+# negotiates it over TLS and needs the optional h2 package, so fall back to
+# a pool of HTTP/1.1 keep-alive connections otherwise
+_HTTP2 = _BASE_URL.startswith("https://") and find_spec("h2") is not None
+
+
+def _json(response):
+    """Decode a JSON response body straight from its raw bytes."""
+    return orjson.loads(response.data)
+
+
+def _ok(response):
+    """Check that a response succeeded and return its decoded JSON body."""
+    if response.status != 200:
+        raise AssertionError(f"{response.status} != 200: {response.data!r}")
+    return _json(response)
 
 
 class TestResourcesAPIIntegration(unittest.TestCase):
     """Integration tests for the Resources API"""
 
-    @classmethod
-    def setUpClass(cls):
-        """Set up the API base URL before running tests."""
-        cls.base_url = os.getenv("API_BASE_URL", "http://localhost:7071/api")
-
-    def test_get_resources_by_batch_with_specific_versions(self):
-        """Test retrieving multiple resources by batch with specific
-        versions."""
-        resource_pairs = [
+    # (id, resource_version) pairs of each batch scenario, None meaning all
+    # versions of the resource
+    BATCH_SCENARIOS = {
+        "specific_versions": [
             ("riscv-ubuntu-20.04-boot", "3.0.0"),
             ("arm-hello64-static", "1.0.0"),
-        ]
-        query_string = "&".join(
-            [
-                f"id={id}&resource_version={version}"
-                for id, version in resource_pairs
-            ]
-        )
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?{query_string}"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertEqual(len(data), 2)
-
-        # Verify each resource is present
-        found_resources = {(r["id"], r["resource_version"]) for r in data}
-        expected_resources = set(resource_pairs)
-        self.assertEqual(found_resources, expected_resources)
-
-    def test_get_resources_by_batch_with_none_versions(self):
-        """Test retrieving multiple resources by batch with None versions
-        (all versions)."""
-        resource_ids = ["riscv-ubuntu-20.04-boot", "arm-hello64-static"]
-        query_string = "&".join(
-            [f"id={id}&resource_version=None" for id in resource_ids]
-        )
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?{query_string}"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreater(len(data), 0)
-
-        # Verify all requested IDs are present
-        found_ids = {r["id"] for r in data}
-        expected_ids = set(resource_ids)
-        self.assertEqual(found_ids, expected_ids)
-
-    def test_get_resources_by_batch_mixed_versions(self):
-        """Test batch retrieval with mix of specific versions and None."""
-        params = {
-            "id": ["riscv-ubuntu-20.04-boot", "arm-hello64-static"],
-            "resource_version": ["3.0.0", "None"],
-        }
-        response = requests.get(
-            f"{self.base_url}/resources/find-resources-in-batch", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertGreater(len(data), 0)
-
-        # Verify both IDs are present
-        found_ids = {r["id"] for r in data}
-        self.assertIn("riscv-ubuntu-20.04-boot", found_ids)
-        self.assertIn("arm-hello64-static", found_ids)
-
-        # Verify specific version constraint
-        riscv_resources = [
-            r for r in data if r["id"] == "riscv-ubuntu-20.04-boot"
-        ]
-        self.assertTrue(
-            all(r["resource_version"] == "3.0.0" for r in riscv_resources)
-        )
-
-    def test_get_resources_by_batch_not_found_partial(self):
-        """Test batch retrieval where one or more resources are missing."""
-        resource_pairs = [
+        ],
+        "none_versions": [
+            ("riscv-ubuntu-20.04-boot", None),
+            ("arm-hello64-static", None),
+        ],
+        "mixed_versions": [
+            ("riscv-ubuntu-20.04-boot", "3.0.0"),
+            ("arm-hello64-static", None),
+        ],
+        "not_found_partial": [
             ("arm-hello64-static", "1.0.0"),
             ("non-existent", "9.9.9"),
-        ]
-        query_string = "&".join(
-            [
-                f"id={id}&resource_version={version}"
-                for id, version in resource_pairs
-            ]
-        )
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?{query_string}"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertEqual(len(data), 1)
-
-        found_ids = [r["id"] for r in data]
-        self.assertEqual(len(found_ids), 1)
-        self.assertEqual("arm-hello64-static", found_ids[0])
-
-    def test_get_resources_by_batch_not_found_all(self):
-        """Test batch retrieval where all resources are missing."""
-        resource_pairs = [
+        ],
+        "not_found_all": [
             ("non-existent-1", "1.0.0"),
             ("non-existent-2", "2.0.0"),
+        ],
+        "valid_id_invalid_version": [
+            ("arm-hello64-static", "1.0.0"),  # Valid
+            ("riscv-ubuntu-20.04-boot", "99.99.99"),  # Invalid version
+        ],
+        # Repeated pairs make this request a stress test as well
+        "maximum_resources": [("arm-hello64-static", "1.0.0")] * 10,
+    }
+
+    # Search shared by several tests, fetched once in setUpClass
+    ARM_HELLO_SEARCH = {"contains-str": "arm-hello64-static"}
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up the API base URL and a shared HTTP connection pool before
+        running tests."""
+        cls.base_url = _BASE_URL
+
+        # Reuse pooled keep-alive connections across all tests
+        cls.http = urllib3.PoolManager(num_pools=4, maxsize=32, block=False)
+
+        # (status code, body) of read-only GETs repeated across tests
+        cls._resp_cache = {}
+
+        # Prefetch the fixtures shared by several tests
+        cls._cached_get(_FILTERS_URL)
+        cls._cached_get(_SEARCH_URL, cls.ARM_HELLO_SEARCH)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared HTTP connection pool."""
+        cls.http.clear()
+
+    @classmethod
+    def _get(cls, url, fields=None):
+        """Send a GET request on the shared connection pool.
+
+        Parameters:
+        - url (str): The URL to request.
+        - fields (dict): Optional query parameters; list values are sent as
+          repeated parameters.
+
+        Returns:
+        - urllib3.BaseHTTPResponse: The response, with its body read.
+        """
+        query = [
+            (name, value)
+            for name, values in (fields or {}).items()
+            for value in (values if isinstance(values, list) else [values])
         ]
-        query_string = "&".join(
+        return cls.http.request("GET", url, fields=query)
+
+    def _get_many(self, calls):
+        """Issue independent GET requests concurrently on the shared pool.
+
+        Parameters:
+        - calls (list): (args, kwargs) pairs passed to ``_get``.
+
+        Returns:
+        - list: The responses, in the same order as ``calls``.
+        """
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            return list(
+                executor.map(
+                    lambda call: self._get(*call[0], **call[1]), calls
+                )
+            )
+
+    @classmethod
+    def _cached_get(cls, url, params=None):
+        """GET a URL once per test class and reuse the response afterwards.
+
+        Parameters:
+        - url (str): The URL to request.
+        - params (dict): Optional query parameters.
+
+        Returns:
+        - tuple: The status code and the decoded JSON body (or the raw text
+          when the response is not JSON).
+        """
+        key = url + "?" + urlencode(sorted((params or {}).items()), doseq=True)
+        hit = cls._resp_cache.get(key)
+        if hit is not None:
+            return hit
+
+        response = cls._get(url, params)
+        if response.headers.get("content-type", "").startswith(
+            "application/json"
+        ):
+            body = _json(response)
+        else:
+            body = response.data.decode()
+        cls._resp_cache[key] = (response.status, body)
+        return cls._resp_cache[key]
+
+    def test_batch_scenarios(self):
+        """Test batch retrieval scenarios, one request per scenario.
+
+        Every scenario is sent as its own request so its exact response is
+        checked; the requests are issued concurrently on the shared pool.
+        """
+        scenarios = self.BATCH_SCENARIOS
+        responses = self._get_many(
             [
-                f"id={id}&resource_version={version}"
-                for id, version in resource_pairs
+                (
+                    (_BATCH_URL,),
+                    {
+                        "fields": {
+                            "id": [id for id, _ in pairs],
+                            "resource_version": [
+                                str(version) for _, version in pairs
+                            ],
+                        }
+                    },
+                )
+                for pairs in scenarios.values()
             ]
         )
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?{query_string}"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertEqual(len(data), 0)
+        results = {
+            name: _ok(response) for name, response in zip(scenarios, responses)
+        }
+        for data in results.values():
+            self.assertIsInstance(data, list)
+
+        with self.subTest("specific_versions"):
+            data = results["specific_versions"]
+            self.assertEqual(len(data), 2)
+            # Verify each resource is present
+            found_resources = {(r["id"], r["resource_version"]) for r in data}
+            self.assertEqual(
+                found_resources, set(scenarios["specific_versions"])
+            )
+
+        with self.subTest("none_versions"):
+            data = results["none_versions"]
+            self.assertGreater(len(data), 0)
+            # Verify all requested IDs are present
+            found_ids = {r["id"] for r in data}
+            self.assertEqual(
+                found_ids,
+                {id for id, _ in scenarios["none_versions"]},
+            )
+
+        with self.subTest("mixed_versions"):
+            data = results["mixed_versions"]
+            # Verify both IDs are present
+            found_ids = {r["id"] for r in data}
+            self.assertIn("riscv-ubuntu-20.04-boot", found_ids)
+            self.assertIn("arm-hello64-static", found_ids)
+            # Verify specific version constraint
+            riscv_resources = [
+                r for r in data if r["id"] == "riscv-ubuntu-20.04-boot"
+            ]
+            self.assertTrue(
+                all(r["resource_version"] == "3.0.0" for r in riscv_resources)
+            )
+
+        for name in ("not_found_partial", "valid_id_invalid_version"):
+            with self.subTest(name):
+                found_ids = [r["id"] for r in results[name]]
+                self.assertEqual(found_ids, ["arm-hello64-static"])
+
+        with self.subTest("not_found_all"):
+            self.assertEqual(results["not_found_all"], [])
+
+        with self.subTest("maximum_resources"):
+            self.assertEqual(len(results["maximum_resources"]), 1)
 
     def test_get_resources_by_batch_mismatched_parameters(self):
         """Test batch retrieval with mismatched number of id and version
         parameters."""
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch"
-            "?id=arm-hello64-static&id=riscv-ubuntu-20.04-boot"
-            "&resource_version=1.0.0"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 400)
-        data = response.json()
+        params = {
+            "id": ["arm-hello64-static", "riscv-ubuntu-20.04-boot"],
+            "resource_version": "1.0.0",
+        }
+        response = self._get(_BATCH_URL, params)
+        self.assertEqual(response.status, 400)
+        data = _json(response)
         self.assertIn("error", data)
         self.assertIn("corresponding", data["error"])
 
     def test_get_resources_by_batch_no_version_parameters(self):
         """Test batch retrieval without any version parameters
         (should fail)."""
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?"
-            "id=arm-hello64-static&id=riscv-ubuntu-20.04-boot"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 400)
-        data = response.json()
+        params = {"id": ["arm-hello64-static", "riscv-ubuntu-20.04-boot"]}
+        response = self._get(_BATCH_URL, params)
+        self.assertEqual(response.status, 400)
+        data = _json(response)
         self.assertIn("error", data)
         self.assertIn("corresponding", data["error"])
 
-    def test_get_resources_by_batch_valid_id_invalid_version(self):
-        """Test batch retrieval with valid ID but invalid version."""
-        resource_pairs = [
-            ("arm-hello64-static", "1.0.0"),  # Valid
-            ("riscv-ubuntu-20.04-boot", "99.99.99"),  # Invalid version
-        ]
-        query_string = "&".join(
-            [
-                f"id={id}&resource_version={version}"
-                for id, version in resource_pairs
-            ]
-        )
-        url = (
-            f"{self.base_url}/resources/find-resources-in-batch?{query_string}"
-        )
-        response = requests.get(url)
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIsInstance(data, list)
-        self.assertEqual(len(data), 1)
-
-        found_ids = [r["id"] for r in data]
-        self.assertEqual(len(found_ids), 1)
-        self.assertEqual("arm-hello64-static", found_ids[0])
-
-    # FILTER ENDPOINT TESTS
     def test_get_filters(self):
         """Test retrieving filter values."""
-        response = requests.get(f"{self.base_url}/resources/filters")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        status, data = self._cached_get(_FILTERS_URL)
+        self.assertEqual(status, 200)
 
         # Verify structure
         self.assertIn("category", data)
@@ -208,9 +270,8 @@ class TestResourcesAPIIntegration(unittest.TestCase):
 
     def test_get_filters_content_validation(self):
         """Test that filter values contain expected content."""
-        response = requests.get(f"{self.base_url}/resources/filters")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        status, data = self._cached_get(_FILTERS_URL)
+        self.assertEqual(status, 200)
 
         # Check that gem5_versions are sorted in reverse order (newest first)
         if len(data["gem5_versions"]) > 1:
@@ -230,13 +291,9 @@ class TestResourcesAPIIntegration(unittest.TestCase):
 
     def test_search_basic_contains_str(self):
         """Test basic search with a contains-str parameter."""
-        params = {"contains-str": "arm-hello64-static"}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
+        status, data = self._cached_get(_SEARCH_URL, self.ARM_HELLO_SEARCH)
 
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        self.assertEqual(status, 200)
         resources = data["documents"]
         # Check that results are returned
         self.assertGreater(len(resources), 0)
@@ -245,12 +302,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
     def test_search_with_single_filter(self):
         """Test search with a single filter criterion."""
         params = {"contains-str": "boot", "must-include": "architecture,x86"}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
         # Validate results match filter criteria
@@ -264,12 +316,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "contains-str": "ubuntu",
             "must-include": "category,workload;architecture,RISCV",
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
         # Validate results match filter criteria
@@ -284,37 +331,29 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "contains-str": "resource",
             "must-include": "gem5_versions,23.0",
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
         # Validate results match filter criteria
-        for resource in resources:
-            self.assertIn("23.0", resource["gem5_versions"])
+        self.assertTrue(all("23.0" in r["gem5_versions"] for r in resources))
 
     def test_search_pagination(self):
         """Test pagination functionality."""
-        # First page
         params_page1 = {"contains-str": "resource", "page": 1, "page-size": 2}
-        response_page1 = requests.get(
-            f"{self.base_url}/resources/search", params=params_page1
+        params_page2 = {"contains-str": "resource", "page": 2, "page-size": 2}
+        # Fetch both pages at once
+        response_page1, response_page2 = self._get_many(
+            [
+                ((_SEARCH_URL,), {"fields": params_page1}),
+                ((_SEARCH_URL,), {"fields": params_page2}),
+            ]
         )
 
-        self.assertEqual(response_page1.status_code, 200)
-        data_page1 = response_page1.json()
+        # First page
+        data_page1 = _ok(response_page1)
         resources_page1 = data_page1["documents"]
         # Second page
-        params_page2 = {"contains-str": "resource", "page": 2, "page-size": 2}
-        response_page2 = requests.get(
-            f"{self.base_url}/resources/search", params=params_page2
-        )
-
-        self.assertEqual(response_page2.status_code, 200)
-        data_page2 = response_page2.json()
+        data_page2 = _ok(response_page2)
         resources_page2 = data_page2["documents"]
 
         # Ensure we have resources to check
@@ -329,46 +368,19 @@ class TestResourcesAPIIntegration(unittest.TestCase):
     def test_search_no_results(self):
         """Test search with no matching results."""
         params = {"contains-str": "invalid"}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
         # Validate empty results
         self.assertEqual(len(resources), 0)
 
-    def test_search_invalid_filter(self):
-        """Test search with invalid filter format."""
-        params = {
-            "contains-str": "resource",
-            "must-include": "invalid-filter-format",
-        }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        # Expecting a 400 Bad Request for invalid filter format
-        self.assertEqual(response.status_code, 400)
-
     def test_search_case_insensitive(self):
         """Test that search is case insensitive."""
         params1 = {"contains-str": "ARM-HELLO64-STATIC"}  # Uppercase
-        params2 = {"contains-str": "arm-hello64-static"}  # Lowercase
-
-        response1 = requests.get(
-            f"{self.base_url}/resources/search", params=params1
-        )
-        response2 = requests.get(
-            f"{self.base_url}/resources/search", params=params2
-        )
-
-        self.assertEqual(response1.status_code, 200)
-        self.assertEqual(response2.status_code, 200)
+        data1 = _ok(self._get(_SEARCH_URL, params1))
+        # Lowercase
+        status2, data2 = self._cached_get(_SEARCH_URL, self.ARM_HELLO_SEARCH)
+        self.assertEqual(status2, 200)
 
-        data1 = response1.json()
-        data2 = response2.json()
         resources1 = data1["documents"]
         resources2 = data2["documents"]
 
@@ -383,58 +395,19 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "contains-str": "resource",
             "must-include": "gem5_versions,22.0,23.0",
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
         # Resources should have at least one of the specified gem5 versions
-        for resource in resources:
-            gem5_versions = set(resource["gem5_versions"])
-            self.assertTrue(
-                len({"22.0", "23.0"}.intersection(gem5_versions)) > 0
-            )
-
-    def test_search_with_special_characters(self):
-        """Test search with special characters in the search string."""
-        params = {"contains-str": "test-resource_with.special-chars"}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)  # Should not crash
-
-    def test_search_with_very_long_string(self):
-        """Test search with a very long contains-str parameter."""
-        params = {"contains-str": "a" * 1000}  # Very long string
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)  # Should handle gracefully
-
-    def test_batch_with_maximum_resources(self):
-        """Test batch retrieval with a reasonable number of resources
-        (stress test)."""
-        # Create 10 resource requests
-        resource_ids = ["arm-hello64-static"] * 10
-        versions = ["1.0.0"] * 10
-
-        params = {"id": resource_ids, "resource_version": versions}
-        response = requests.get(
-            f"{self.base_url}/resources/find-resources-in-batch", params=params
+        wanted = {"22.0", "23.0"}
+        self.assertTrue(
+            all(not wanted.isdisjoint(r["gem5_versions"]) for r in resources)
         )
-        self.assertEqual(response.status_code, 200)
 
     def test_search_without_contains_str(self):
         """Test search without contains-str returns all resources."""
         params = {"page": 1, "page-size": 5}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         self.assertIn("documents", data)
         self.assertIn("totalCount", data)
         self.assertGreater(len(data["documents"]), 0)
@@ -442,11 +415,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
     def test_search_sort_by_id_asc(self):
         """Test search with sort by id ascending."""
         params = {"contains-str": "arm", "sort": "id_asc", "page-size": 10}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
         if len(resources) > 1:
             ids = [r["id"].lower() for r in resources]
@@ -455,11 +424,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
     def test_search_sort_by_id_desc(self):
         """Test search with sort by id descending."""
         params = {"contains-str": "arm", "sort": "id_desc", "page-size": 10}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
         if len(resources) > 1:
             ids = [r["id"].lower() for r in resources]
@@ -468,11 +433,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
     def test_search_total_count(self):
         """Test that totalCount is accurate."""
         params = {"contains-str": "arm", "page": 1, "page-size": 2}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         self.assertIn("totalCount", data)
         self.assertIsInstance(data["totalCount"], int)
         self.assertGreaterEqual(data["totalCount"], len(data["documents"]))
@@ -483,13 +444,9 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "contains-str": "hello",
             "must-include": "architecture,x86,ARM",
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        for resource in data["documents"]:
-            self.assertIn(resource["architecture"], ["x86", "ARM"])
+        data = _ok(self._get(_SEARCH_URL, params))
+        archs = {r["architecture"] for r in data["documents"]}
+        self.assertLessEqual(archs, {"x86", "ARM"})
 
     def test_search_pagination_beyond_results(self):
         """Test pagination when page is beyond available results."""
@@ -498,50 +455,60 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "page": 1000,
             "page-size": 10,
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         self.assertEqual(len(data["documents"]), 0)  # No results on this page
 
-    def test_search_pagination_max_page_size(self):
-        """Test pagination with maximum page-size (100)."""
-        params = {"contains-str": "resource", "page": 1, "page-size": 100}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-
-    def test_search_pagination_exceeds_max_page_size(self):
-        """Test pagination with page-size exceeding max (should fail)."""
-        params = {"contains-str": "resource", "page": 1, "page-size": 101}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_search_pagination_invalid_page(self):
-        """Test pagination with invalid page number (should fail)."""
-        params = {"contains-str": "resource", "page": 0, "page-size": 10}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 400)
-
     def test_search_returns_latest_version_only(self):
         """Test that search returns only the latest version of each resource."""
         params = {"contains-str": "ubuntu", "page-size": 50}
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
-        # Check no duplicate IDs (each resource appears only once)
+        # Check no duplicate IDs (each resource appears only once), stopping
+        # at the first duplicate
+        seen = set()
+        duplicate = None
+        for resource in resources:
+            if resource["id"] in seen:
+                duplicate = resource["id"]
+                break
+            seen.add(resource["id"])
+        self.assertIsNone(duplicate)
+
+    def test_search_returns_highest_version(self):
+        """Test that the version search returns is the highest one of each
+        resource."""
+        params = {"contains-str": "riscv-ubuntu-20.04-boot", "page-size": 10}
+        resources = _ok(self._get(_SEARCH_URL, params))["documents"]
+        if not resources:
+            self.skipTest("No resources to compare versions of")
+
+        # Fetch every version of the resources found
         ids = [r["id"] for r in resources]
-        self.assertEqual(len(ids), len(set(ids)))
+        params = {"id": ids, "resource_version": ["None"] * len(ids)}
+        data_all = _ok(self._get(_BATCH_URL, params))
+
+        # Parse each version once and keep the highest one per id
+        parsed = [
+            (
+                r["id"],
+                tuple(
+                    int(x) for x in r.get("resource_version", "0").split(".")
+                ),
+            )
+            for r in data_all
+        ]
+        max_versions = {}
+        for rid, version in parsed:
+            current = max_versions.get(rid)
+            if current is None or version > current:
+                max_versions[rid] = version
+
+        for resource in resources:
+            version = tuple(
+                int(x) for x in resource["resource_version"].split(".")
+            )
+            self.assertEqual(version, max_versions[resource["id"]])
 
     def test_search_combined_filters_sort_pagination(self):
         """Test search with filters, sorting, and pagination combined."""
@@ -552,11 +519,7 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             "page": 1,
             "page-size": 5,
         }
-        response = requests.get(
-            f"{self.base_url}/resources/search", params=params
-        )
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = _ok(self._get(_SEARCH_URL, params))
         resources = data["documents"]
 
         # Validate architecture filter
@@ -569,5 +532,75 @@ class TestResourcesAPIIntegration(unittest.TestCase):
             self.assertEqual(ids, sorted(ids))
 
 
+class AsyncTestResourcesAPI(unittest.IsolatedAsyncioTestCase):
+    """Integration tests for the Resources API issuing their requests
+    concurrently on one event loop"""
+
+    # Search parameters of each case and the status code it must return
+    SEARCH_STATUS_CASES = {
+        "invalid_filter": (
+            {
+                "contains-str": "resource",
+                "must-include": "invalid-filter-format",
+            },
+            400,
+        ),
+        "special_characters": (
+            {
+                "contains-str": "test-resource_with.special-chars",
+                "page-size": 1,
+            },
+            200,
+        ),
+        "very_long_string": (
+            {"contains-str": "a" * 1000, "page-size": 1},
+            200,
+        ),
+        "pagination_max_page_size": (
+            {"contains-str": "resource", "page": 1, "page-size": 100},
+            200,
+        ),
+        "pagination_exceeds_max_page_size": (
+            {"contains-str": "resource", "page": 1, "page-size": 101},
+            400,
+        ),
+        "pagination_invalid_page": (
+            {"contains-str": "resource", "page": 0, "page-size": 10},
+            400,
+        ),
+    }
+
+    async def asyncSetUp(self):
+        """Open an async HTTP client for the test's requests."""
+        self.client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=1 if _HTTP2 else 32),
+        )
+
+    async def asyncTearDown(self):
+        """Close the async HTTP client."""
+        await self.client.aclose()
+
+    async def _status(self, url, params=None):
+        """Return the status code of a GET request without reading its
+        body."""
+        async with self.client.stream("GET", url, params=params) as response:
+            return response.status_code
+
+    async def test_search_status_codes(self):
+        """Test the status code of searches with unusual or invalid
+        parameters."""
+        cases = self.SEARCH_STATUS_CASES
+        statuses = await asyncio.gather(
+            *(
+                self._status(_SEARCH_URL, params)
+                for params, _ in cases.values()
+            )
+        )
+        for (name, (_, expected)), status in zip(cases.items(), statuses):
+            with self.subTest(name):
+                self.assertEqual(status, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
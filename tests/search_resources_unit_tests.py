@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 The Regents of the University of California
+# SPDX-License-Identifier: BSD-3-Clause
+
+import unittest
+
+import azure.functions as func
+import orjson
+from azure.search.documents.indexes.models import (
+    ScoringProfile,
+    SearchableField,
+    SearchIndex,
+    SimpleField,
+)
+
+from functions import search_resources
+from functions.search_resources import (
+    LATEST_VERSION_FILTER,
+    MAX_RESULTS,
+    MAX_SKIP,
+    apply_sorting,
+    build_odata_filter,
+    get_order_by,
+)
+from shared.search_index import (
+    ID_SORT_FIELD,
+    LATEST_FIELD,
+    SCORING_PROFILE,
+)
+from shared.utils import keep_latest_versions
+
+# Fields of the resources index before update_search_index.py prepares it
+_BASE_FIELDS = [
+    SimpleField(name="key", type="Edm.String", key=True),
+    SearchableField(name="id", sortable=True),
+    SimpleField(name="resource_version", type="Edm.String"),
+    SimpleField(name="date", type="Edm.String", sortable=True),
+    SimpleField(name="gem5_versions", type="Collection(Edm.String)"),
+]
+
+# Index definition without the latest flag, id_sort and the scoring profile
+UNPREPARED_INDEX = SearchIndex(name="resources", fields=_BASE_FIELDS)
+
+# Index definition after update_search_index.py has run
+PREPARED_INDEX = SearchIndex(
+    name="resources",
+    fields=_BASE_FIELDS
+    + [
+        SimpleField(name=LATEST_FIELD, type="Edm.Boolean", filterable=True),
+        SimpleField(name=ID_SORT_FIELD, type="Edm.String", sortable=True),
+    ],
+    scoring_profiles=[ScoringProfile(name=SCORING_PROFILE)],
+)
+
+
+def _doc(id, version, gem5_version="24.0", score=1.0):
+    """Build a search result as yielded by the Azure AI Search SDK."""
+    return {
+        "key": f"{id}-{version}",
+        "id": id,
+        "resource_version": version,
+        "gem5_versions": [gem5_version],
+        "@search.score": score,
+    }
+
+
+class _StubResults:
+    """Asynchronous search results yielding the given documents."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        async def iterate():
+            for document in self.documents:
+                yield document
+
+        return iterate()
+
+    async def get_count(self):
+        return len(self.documents)
+
+
+class _StubSearchClient:
+    """Search client recording its calls and returning fixed documents."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.calls = []
+
+    async def search(self, **kwargs):
+        self.calls.append(kwargs)
+        return _StubResults([dict(d) for d in self.documents])
+
+
+class _StubApp:
+    """Function app keeping the handler registered by a function module."""
+
+    def function_name(self, name):
+        return lambda handler: handler
+
+    def route(self, route, **kwargs):
+        def register(handler):
+            self.handler = handler
+            return handler
+
+        return register
+
+
+class TestSearchHelpers(unittest.TestCase):
+    """Unit tests for the helpers of the search endpoint"""
+
+    def test_build_odata_filter(self):
+        """Test that filters on several fields are combined with and."""
+        query_object = {
+            "query": "",
+            "sort": "default",
+            "category": ["workload"],
+            "tags": ["a", "b"],
+        }
+        self.assertEqual(
+            build_odata_filter(query_object),
+            "category eq 'workload' and "
+            "(tags/any(x: x eq 'a') or tags/any(x: x eq 'b'))",
+        )
+
+    def test_build_odata_filter_escapes_quotes(self):
+        """Test that single quotes in filter values are doubled."""
+        self.assertEqual(
+            build_odata_filter({"architecture": ["a'b"]}),
+            "architecture eq 'a''b'",
+        )
+
+    def test_build_odata_filter_without_filters(self):
+        """Test that no filter is built without filter fields."""
+        self.assertIsNone(build_odata_filter({"query": "", "sort": "date"}))
+
+    def test_get_order_by_prepared_index(self):
+        """Test that the id sorts order by id_sort on a prepared index."""
+        self.assertEqual(
+            get_order_by("id_desc", PREPARED_INDEX), [f"{ID_SORT_FIELD} desc"]
+        )
+        self.assertEqual(
+            get_order_by("date", PREPARED_INDEX), ["date desc", "id asc"]
+        )
+        self.assertIsNone(get_order_by("version", PREPARED_INDEX))
+
+    def test_get_order_by_unprepared_index(self):
+        """Test that the id sorts are left to apply_sorting without
+        id_sort."""
+        for index in (UNPREPARED_INDEX, None):
+            with self.subTest(index=index and index.name):
+                self.assertIsNone(get_order_by("name", index))
+                self.assertIsNone(get_order_by("id_asc", index))
+                self.assertEqual(
+                    get_order_by("default", index),
+                    ["search.score() desc", "id asc"],
+                )
+
+    def test_apply_sorting_ignores_id_case(self):
+        """Test that the id sorts are case-insensitive."""
+        documents = [
+            _doc("b", "1.0.0"),
+            _doc("C", "1.0.0"),
+            _doc("a", "1.0.0"),
+        ]
+        self.assertEqual(
+            [d["id"] for d in apply_sorting(documents, "id_asc")],
+            ["a", "b", "C"],
+        )
+
+    def test_keep_latest_versions(self):
+        """Test that only the highest semantic version of each resource is
+        kept and documents without an id are dropped."""
+        documents = [
+            _doc("a", "1.9.0"),
+            _doc("a", "1.10.0"),
+            _doc("b", "2.0.0"),
+            {"resource_version": "1.0.0"},
+        ]
+        self.assertEqual(
+            [
+                (d["id"], d["resource_version"])
+                for d in keep_latest_versions(documents)
+            ],
+            [("a", "1.10.0"), ("b", "2.0.0")],
+        )
+
+
+class TestSearchResourcesHandler(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the search endpoint with a stub search client and
+    index definition"""
+
+    # Index definitions the endpoint must handle the same way
+    INDEXES = {"prepared": PREPARED_INDEX, "unprepared": UNPREPARED_INDEX}
+
+    async def _search(self, index, documents, params=None):
+        """Call the search endpoint once.
+
+        Parameters:
+        - index (SearchIndex or Exception): The index definition, or the
+          error raised when fetching it.
+        - documents (list): Documents returned by the stub search client.
+        - params (dict): Optional query parameters.
+
+        Returns:
+        - tuple: The status code, the decoded JSON body and the keyword
+          arguments of the search client call.
+        """
+
+        async def get_search_index():
+            if isinstance(index, Exception):
+                raise index
+            return index
+
+        app = _StubApp()
+        client = _StubSearchClient(documents)
+        search_resources.register_function(
+            app, lambda: client, get_search_index
+        )
+        request = func.HttpRequest(
+            method="GET",
+            url="/api/resources/search",
+            params=params or {},
+            body=b"",
+        )
+        response = await app.handler(request)
+        body = orjson.loads(response.get_body())
+        return (
+            response.status_code,
+            body,
+            client.calls[-1] if client.calls else None,
+        )
+
+    async def test_prepared_index_pages_server_side(self):
+        """Test that a prepared index filters, boosts and pages in the
+        search service."""
+        status, body, call = await self._search(
+            PREPARED_INDEX,
+            [_doc("a", "1.0.0")],
+            {"contains-str": "arm", "page": "3", "page-size": "5"},
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(call["filter"], LATEST_VERSION_FILTER)
+        self.assertEqual(call["scoring_profile"], SCORING_PROFILE)
+        self.assertNotIn("id:", call["search_text"])
+        self.assertEqual((call["top"], call["skip"]), (5, 10))
+        self.assertTrue(call["include_total_count"])
+        self.assertNotIn(LATEST_FIELD, call["select"])
+        self.assertNotIn(ID_SORT_FIELD, call["select"])
+        self.assertEqual(body["totalCount"], 1)
+
+    async def test_prepared_index_combines_filters(self):
+        """Test that must-include filters keep the latest-version filter."""
+        _, _, call = await self._search(
+            PREPARED_INDEX, [], {"must-include": "category,workload"}
+        )
+        self.assertEqual(
+            call["filter"],
+            f"category eq 'workload' and {LATEST_VERSION_FILTER}",
+        )
+
+    async def test_prepared_index_clamps_skip(self):
+        """Test that pages past the service's skip limit only request the
+        total count."""
+        _, _, call = await self._search(
+            PREPARED_INDEX,
+            [],
+            {"page": str(MAX_SKIP // 10 + 2), "page-size": "10"},
+        )
+        self.assertEqual((call["top"], call["skip"]), (0, MAX_SKIP))
+
+    async def test_unprepared_index_deduplicates_versions(self):
+        """Test that an index without the latest flag is deduplicated and
+        paged here, with the id boost written into the query."""
+        status, body, call = await self._search(
+            UNPREPARED_INDEX,
+            [_doc("a", "1.0.0"), _doc("a", "2.0.0"), _doc("b", "1.0.0")],
+            {"contains-str": "arm", "page-size": "1"},
+        )
+        self.assertEqual(status, 200)
+        self.assertIsNone(call["filter"])
+        self.assertIsNone(call["scoring_profile"])
+        self.assertIn("id:", call["search_text"])
+        self.assertEqual(call["top"], MAX_RESULTS)
+        self.assertNotIn("skip", call)
+        self.assertEqual(body["totalCount"], 2)
+        self.assertEqual(
+            [(d["id"], d["resource_version"]) for d in body["documents"]],
+            [("a", "2.0.0")],
+        )
+
+    async def test_unreadable_index_falls_back(self):
+        """Test that search still works when the index definition cannot
+        be read and no internal field is returned."""
+        document = _doc("a", "1.0.0")
+        document[LATEST_FIELD] = True
+        document[ID_SORT_FIELD] = "a"
+        status, body, call = await self._search(
+            RuntimeError("forbidden"), [document]
+        )
+        self.assertEqual(status, 200)
+        self.assertIsNone(call["select"])
+        self.assertEqual(call["top"], MAX_RESULTS)
+        self.assertEqual(
+            body["documents"],
+            [
+                {
+                    "key": "a-1.0.0",
+                    "id": "a",
+                    "resource_version": "1.0.0",
+                    "gem5_versions": ["24.0"],
+                    "score": 1.0,
+                    "database": "gem5-vision",
+                }
+            ],
+        )
+
+    async def test_id_sort_without_id_sort_field(self):
+        """Test that the id sorts stay case-insensitive on an unprepared
+        index."""
+        _, body, call = await self._search(
+            UNPREPARED_INDEX,
+            [_doc("b", "1.0.0"), _doc("C", "1.0.0"), _doc("a", "1.0.0")],
+            {"sort": "id_asc"},
+        )
+        self.assertIsNone(call["order_by"])
+        self.assertEqual([d["id"] for d in body["documents"]], ["a", "b", "C"])
+
+    async def test_version_sort(self):
+        """Test that the version sort is applied to the first matches on
+        both indexes."""
+        for name, index in self.INDEXES.items():
+            with self.subTest(name):
+                _, body, call = await self._search(
+                    index,
+                    [_doc("a", "1.0.0", "22.0"), _doc("b", "1.0.0", "24.0")],
+                    {"sort": "version"},
+                )
+                self.assertEqual(call["top"], MAX_RESULTS)
+                self.assertEqual(
+                    [d["id"] for d in body["documents"]], ["b", "a"]
+                )
+
+    async def test_must_include_ignores_other_fields(self):
+        """Test that must-include groups cannot override the sort."""
+        for name, index in self.INDEXES.items():
+            with self.subTest(name):
+                status, _, call = await self._search(
+                    index,
+                    [_doc("a", "1.0.0")],
+                    {"must-include": "sort,date", "sort": "id_desc"},
+                )
+                self.assertEqual(status, 200)
+                self.assertNotIn("sort", call["filter"] or "")
+                self.assertEqual(
+                    call["order_by"], get_order_by("id_desc", index)
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@
 Script to update the filter values collection.
 This script runs as a GitHub Action to periodically update the materialized view
 of filter values from the resources collection.
+It also makes sure the indexes used by the API queries exist.
 """
 
 import logging
@@ -18,6 +19,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 from pymongo import MongoClient
 
+from shared.database import ensure_indexes
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,7 +52,10 @@ def main():
         resources_collection = db.resources
         filter_values_collection = db.filter_values
 
-        logger.info("Connected to MongoDB. Starting filter values update.")
+        logger.info("Connected to MongoDB. Ensuring resource indexes.")
+        ensure_indexes(resources_collection)
+
+        logger.info("Starting filter values update.")
 
         # Build the aggregation pipeline to get distinct values
         pipeline = [
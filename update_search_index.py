@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 The Regents of the University of California
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Script to update the Azure AI Search index used by the search endpoint.
+This script is meant to run after resources are (re)indexed. It makes sure
+the index defines the "is_latest" and "id_sort" fields and the "boost_id"
+scoring profile. It sets "is_latest" to true only on the latest version of
+every resource, so the search endpoint can filter out older versions
+server-side instead of deduplicating results in Python, and "id_sort" to
+the lowercased id, so ids are sorted case-insensitively.
+"""
+
+import logging
+
+from azure.core.credentials import AzureKeyCredential
+from azure.search.documents.indexes import SearchIndexClient
+from azure.search.documents.indexes.models import (
+    ScoringProfile,
+    SimpleField,
+    TextWeights,
+)
+from dotenv import load_dotenv
+
+from shared.azure_search_client import (
+    get_search_client,
+    get_search_settings,
+)
+from shared.search_index import (
+    ID_SORT_FIELD,
+    ID_WEIGHT,
+    LATEST_FIELD,
+    SCORING_PROFILE,
+    has_field,
+    has_scoring_profile,
+)
+from shared.utils import keep_latest_versions
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Load environment variables (for local testing)
+load_dotenv()
+
+# Maximum number of documents per indexing request
+BATCH_SIZE = 1000
+
+
+def update_index_definition(index_client, index):
+    """
+    Add the definitions the search endpoint relies on to the index if they
+    are missing: the filterable latest-version flag, the sortable lowercase
+    id and the scoring profile boosting matches on id.
+    """
+    changed = False
+
+    if not has_field(index, LATEST_FIELD):
+        logger.info(f"Adding '{LATEST_FIELD}' field to index {index.name}.")
+        index.fields.append(
+            SimpleField(name=LATEST_FIELD, type="Edm.Boolean", filterable=True)
+        )
+        changed = True
+
+    if not has_field(index, ID_SORT_FIELD):
+        logger.info(f"Adding '{ID_SORT_FIELD}' field to index {index.name}.")
+        index.fields.append(
+            SimpleField(name=ID_SORT_FIELD, type="Edm.String", sortable=True)
+        )
+        changed = True
+
+    if not has_scoring_profile(index, SCORING_PROFILE):
+        logger.info(f"Adding '{SCORING_PROFILE}' scoring profile.")
+        index.scoring_profiles = (index.scoring_profiles or []) + [
+            ScoringProfile(
+                name=SCORING_PROFILE,
+                text_weights=TextWeights(weights={"id": ID_WEIGHT}),
+            )
+        ]
+        changed = True
+
+    if changed:
+        index_client.create_or_update_index(index)
+
+
+def main():
+    """Main function to update the search index definition and flags."""
+    try:
+        # Get Azure AI Search connection details from environment variables
+        endpoint, api_key, index_name = get_search_settings()
+
+        index_client = SearchIndexClient(
+            endpoint=endpoint, credential=AzureKeyCredential(api_key)
+        )
+        search_client = get_search_client()
+
+        index = index_client.get_index(index_name)
+        key_field = next(field.name for field in index.fields if field.key)
+        update_index_definition(index_client, index)
+
+        logger.info("Connected to Azure AI Search. Starting flags update.")
+
+        # Fetch every document of the index, only with the fields needed to
+        # work out which version of each resource is the latest one. All
+        # documents score the same, so they are ordered by key to keep the
+        # pages from skipping or repeating documents.
+        documents = list(
+            search_client.search(
+                search_text="*",
+                order_by=[key_field],
+                select=[
+                    key_field,
+                    "id",
+                    "resource_version",
+                    LATEST_FIELD,
+                    ID_SORT_FIELD,
+                ],
+            )
+        )
+        latest_keys = {
+            doc[key_field] for doc in keep_latest_versions(documents)
+        }
+
+        # Only send the documents whose flag or sort id actually changes
+        updates = []
+        for doc in documents:
+            resource_id = doc.get("id")
+            if not resource_id:
+                continue
+
+            is_latest = doc[key_field] in latest_keys
+            id_sort = resource_id.lower()
+            if (
+                doc.get(LATEST_FIELD) is not is_latest
+                or doc.get(ID_SORT_FIELD) != id_sort
+            ):
+                updates.append(
+                    {
+                        key_field: doc[key_field],
+                        LATEST_FIELD: is_latest,
+                        ID_SORT_FIELD: id_sort,
+                    }
+                )
+
+        for start in range(0, len(updates), BATCH_SIZE):
+            search_client.merge_documents(
+                documents=updates[start : start + BATCH_SIZE]
+            )
+
+        logger.info(
+            f"Updated '{LATEST_FIELD}' and '{ID_SORT_FIELD}' on "
+            f"{len(updates)} of {len(documents)} documents."
+        )
+
+    except Exception as e:
+        logger.error(f"Error updating search index: {str(e)}")
+        raise
+    finally:
+        # Close the Azure AI Search connections
+        if "search_client" in locals():
+            search_client.close()
+        if "index_client" in locals():
+            index_client.close()
+            logger.info("Azure AI Search connection closed.")
+
+
+if __name__ == "__main__":
+    main()